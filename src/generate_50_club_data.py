@@ -4,22 +4,119 @@ Uses incremental updates - only scans new games since last check
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 import json
 import os
+from operator import itemgetter
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+try:
+    import requests_cache
+except ImportError:  # Optional - without it every run refetches all box scores
+    requests_cache = None
+
+try:
+    import orjson
+except ImportError:  # Optional - stdlib json produces identical output, just slower
+    orjson = None
+
+# Game dates are stored in Pacific Time because the DoorDash promo is PT-based
+PACIFIC = ZoneInfo('America/Los_Angeles')
+
+# Box score fetches are independent network-bound requests, so overlap them
+# instead of paying one ESPN round-trip per game serially
+BOX_SCORE_WORKERS = 16
+
+# Save scan progress every N games so an interrupted --full run can resume
+CHECKPOINT_INTERVAL = 50
+
+# Cached box scores live about one season (regular season plus playoffs), so a
+# --full rescan still hits the cache while last season's games age out
+BOX_SCORE_CACHE_DAYS = 270
+
+# Bumped when the checkpoint format changes; older checkpoints are discarded.
+# Version 1 also recorded games whose box score fetch failed, so resuming from
+# one would skip exactly the games that still need a retry
+CHECKPOINT_VERSION = 2
+
+# Connection pool must be at least as wide as the thread pool,
+# otherwise workers wait on (or discard) pooled keep-alive connections
+HTTP_POOL_SIZE = 32
+
+def json_loads(raw):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(data):
+    """Encode data as indented UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 class SeasonClubGenerator:
     def __init__(self, json_path):
         self.scoreboard_url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
         self.summary_url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
         self.json_path = json_path
+        self.cache_path = Path(json_path).parent / 'http_cache.sqlite'
+        self.checkpoint_path = Path(json_path).parent / '.checkpoint.json'
+        # Canonical scorer store keyed on (date, player, points) for O(1) dedup
+        self._scorer_index = {}
+        # Games whose box score was already scanned by a previous run
+        self._processed_game_ids = set()
+        self.session = self._create_session()
+
+    def _create_session(self):
+        """Create a shared HTTP session with keep-alive pooling and retries"""
+        if requests_cache is not None:
+            # Box scores are only fetched for STATUS_FINAL games and never change,
+            # so cache them for the season. Scoreboard responses can include
+            # in-progress games and must always come from ESPN.
+            session = requests_cache.CachedSession(
+                str(self.cache_path),
+                backend='sqlite',
+                urls_expire_after={
+                    self.summary_url: timedelta(days=BOX_SCORE_CACHE_DAYS),
+                    '*': requests_cache.DO_NOT_CACHE
+                },
+                allowable_methods=['GET'],
+                cache_control=False
+            )
+            # Expired entries are only replaced when refetched, so drop them
+            # up front to keep the file from growing across seasons
+            session.cache.delete(expired=True)
+        else:
+            session = requests.Session()
+
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=retries
+        )
+        session.mount('https://', adapter)
+        session.headers.update({
+            'Accept-Encoding': 'gzip',
+            'User-Agent': 'nba50/1.0'
+        })
+        return session
 
     def get_current_season(self):
         """Get current NBA season (e.g., '2024-25')"""
-        pacific = ZoneInfo('America/Los_Angeles')
-        now = datetime.now(pacific)
+        now = datetime.now(PACIFIC)
         year = now.year
         month = now.month
 
@@ -31,8 +128,7 @@ class SeasonClubGenerator:
 
     def get_season_start_date(self):
         """Get approximate season start date (October 15 of current season year)"""
-        pacific = ZoneInfo('America/Los_Angeles')
-        now = datetime.now(pacific)
+        now = datetime.now(PACIFIC)
         year = now.year
         month = now.month
 
@@ -41,7 +137,7 @@ class SeasonClubGenerator:
             year -= 1
 
         # NBA season typically starts mid-October
-        return datetime(year, 10, 15, tzinfo=pacific)
+        return datetime(year, 10, 15, tzinfo=PACIFIC)
 
     def load_existing_data(self):
         """Load existing JSON data if it exists"""
@@ -49,35 +145,42 @@ class SeasonClubGenerator:
             return None
 
         try:
-            with open(self.json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.json_path, 'rb') as f:
+                data = json_loads(f.read())
+
+            self._scorer_index = {
+                self._scorer_key(scorer): scorer
+                for scorer in data.get('scorers', [])
+            }
+            self._processed_game_ids = set(data.get('processedGameIds', []))
+            return data
         except Exception as e:
             print(f"Warning: Could not load existing data: {e}")
             return None
 
+    @staticmethod
+    def _scorer_key(scorer):
+        """Dedup key for a scorer entry (same player, date, points)"""
+        return (scorer['date'], scorer['player'], scorer['points'])
+
     def get_games_for_date_range(self, start_date, end_date):
         """Get all completed games in a date range"""
         games_list = []
 
         print(f"Scanning games from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}...")
 
-        # ESPN API allows batch requests with date range
-        start_str = start_date.strftime("%Y%m%d")
-        end_str = end_date.strftime("%Y%m%d")
+        # ESPN caps scoreboard responses, so split the range into month-sized
+        # windows (each well under the limit) and fetch them concurrently
+        windows = self._month_windows(start_date, end_date)
 
         try:
-            response = requests.get(
-                self.scoreboard_url,
-                params={
-                    'dates': f"{start_str}-{end_str}",
-                    'limit': 1000  # Get up to 1000 games
-                },
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+            events_by_id = {}
+            with ThreadPoolExecutor(max_workers=max(1, min(len(windows), BOX_SCORE_WORKERS))) as executor:
+                for window_events in executor.map(self._fetch_scoreboard_chunk, windows):
+                    for event in window_events:
+                        events_by_id.setdefault(event['id'], event)
 
-            events = data.get('events', [])
+            events = events_by_id.values()
 
             for event in events:
                 status = event.get('status', {}).get('type', {}).get('name', '')
@@ -87,12 +190,11 @@ class SeasonClubGenerator:
                     # Parse ISO date and convert to Pacific Time for correct game date
                     # PT is used because DoorDash promo is PT-based (9am-11:59pm PT)
                     if game_date:
-                        # Parse UTC time
-                        date_obj_utc = datetime.fromisoformat(game_date.replace('Z', '+00:00'))
+                        # Parse UTC time (ESPN uses a trailing 'Z', e.g. 2025-11-23T00:30Z)
+                        date_obj_utc = datetime.fromisoformat(game_date.removesuffix('Z')).replace(tzinfo=timezone.utc)
 
                         # Convert to Pacific Time (handles DST automatically)
-                        pacific = ZoneInfo('America/Los_Angeles')
-                        date_obj_pt = date_obj_utc.astimezone(pacific)
+                        date_obj_pt = date_obj_utc.astimezone(PACIFIC)
 
                         games_list.append({
                             'game_id': event['id'],
@@ -104,54 +206,100 @@ class SeasonClubGenerator:
 
             print(f"Found {len(games_list)} completed games\n")
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             print(f"Error fetching games: {e}")
 
         return games_list
 
+    @staticmethod
+    def _month_windows(start_date, end_date):
+        """Split a date range into (start, end) date pairs, one per calendar month"""
+        windows = []
+        window_start = start_date.date()
+        last_day = end_date.date()
+
+        while window_start <= last_day:
+            next_month = (window_start.replace(day=1) + timedelta(days=32)).replace(day=1)
+            windows.append((window_start, min(next_month - timedelta(days=1), last_day)))
+            window_start = next_month
+
+        return windows
+
+    def _fetch_scoreboard_chunk(self, window):
+        """Get raw scoreboard events for one (start, end) date window"""
+        window_start, window_end = window
+
+        # ESPN API allows batch requests with date range
+        response = self.session.get(
+            self.scoreboard_url,
+            params={
+                'dates': f"{window_start.strftime('%Y%m%d')}-{window_end.strftime('%Y%m%d')}",
+                'limit': 1000  # A month is ~250 games, well under the cap
+            },
+            timeout=30
+        )
+        response.raise_for_status()
+        return json_loads(response.content).get('events', [])
+
     def get_box_score(self, game_id):
-        """Get box score for a game and return all players with stats"""
+        """Get box score for a game and return its 50+ scorers
+
+        Returns:
+            list: 50+ scorers (empty if nobody reached 50), or None if the box
+            score could not be fetched - the game must then be retried next run
+        """
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.summary_url,
                 params={'event': game_id},
                 timeout=10
             )
             response.raise_for_status()
-            data = response.json()
+            players_data = json_loads(response.content).get('boxscore', {}).get('players', [])
+
+            team_rows = []
 
-            boxscore = data.get('boxscore', {})
-            players_data = boxscore.get('players', [])
+            for team in players_data:
+                athletes = [
+                    player
+                    for stat_group in team.get('statistics', [])
+                    for player in stat_group.get('athletes', [])
+                ]
+                points = [self._points_from_stats(player.get('stats', [])) for player in athletes]
+                team_rows.append((team, athletes, points))
+
+            # Almost no game has a 50-point scorer, so one max() over the
+            # points columns settles the common case before any dict is built
+            if max((max(points, default=0) for _, _, points in team_rows), default=0) < 50:
+                return []
 
             all_players = []
 
-            for team in players_data:
+            for team, athletes, points in team_rows:
                 team_abbr = team.get('team', {}).get('abbreviation', 'UNK')
 
-                for stat_group in team.get('statistics', []):
-                    for player in stat_group.get('athletes', []):
-                        athlete = player.get('athlete', {})
-                        stats = player.get('stats', [])
-
-                        # Points is at index 1
-                        if stats and len(stats) > 1:
-                            try:
-                                points = int(stats[1]) if stats[1] != '' else 0
-
-                                if points >= 50:  # Only return 50+ scorers
-                                    all_players.append({
-                                        'name': athlete.get('displayName', 'Unknown'),
-                                        'points': points,
-                                        'team': team_abbr
-                                    })
-                            except (ValueError, TypeError):
-                                continue
+                for i, player_points in enumerate(points):
+                    if player_points >= 50:  # Only return 50+ scorers
+                        all_players.append({
+                            'name': athletes[i].get('athlete', {}).get('displayName', 'Unknown'),
+                            'points': player_points,
+                            'team': team_abbr
+                        })
 
             return all_players
 
-        except requests.exceptions.RequestException:
-            # Silently skip errors - some games might not have box scores yet
-            return []
+        except (requests.exceptions.RequestException, ValueError):
+            # Some games might not have box scores yet - report the failure
+            # instead of "no 50+ scorer" so the game is not marked as scanned
+            return None
+
+    @staticmethod
+    def _points_from_stats(stats):
+        """Points from an athlete's stats row (index 1), 0 if missing or invalid"""
+        # DNP rows have '' or no stats at all - a cheap isdecimal() guard
+        # replaces the try/except around int() on every athlete
+        points = stats[1] if len(stats) > 1 else None
+        return int(points) if isinstance(points, str) and points.isdecimal() else 0
 
     def update_50_club_data(self, force_full_scan=False):
         """
@@ -169,8 +317,7 @@ class SeasonClubGenerator:
 
         # Determine date range to scan
         # Use Pacific Time since game dates are stored in PT
-        pacific = ZoneInfo('America/Los_Angeles')
-        end_date = datetime.now(pacific)
+        end_date = datetime.now(PACIFIC)
 
         if existing_data and not force_full_scan:
             # Incremental update - scan from last checked date
@@ -179,7 +326,7 @@ class SeasonClubGenerator:
             last_checked = existing_data.get('lastCheckedDate')
             if last_checked:
                 # Parse as PT date (lastCheckedDate is stored in PT)
-                start_date = datetime.fromisoformat(last_checked).replace(tzinfo=pacific)
+                start_date = datetime.fromisoformat(last_checked).replace(tzinfo=PACIFIC)
                 print(f"[INCREMENTAL UPDATE]")
                 print(f"Last checked: {last_checked}")
                 print(f"Scanning from that date to now...\n")
@@ -190,10 +337,13 @@ class SeasonClubGenerator:
         else:
             # First run or forced full scan
             start_date = self.get_season_start_date()
+            self._processed_game_ids = set()
             print(f"[FULL SCAN] (first run)\n")
 
-        # Get games in date range
-        games = self.get_games_for_date_range(start_date, end_date)
+        # Get games in date range, skipping any already scanned by a previous run
+        # (lastCheckedDate is always rescanned, and CI retries rerun the same window)
+        all_games = self.get_games_for_date_range(start_date, end_date)
+        games = [game for game in all_games if game['game_id'] not in self._processed_game_ids]
 
         if not games:
             print("No new games to check")
@@ -201,91 +351,181 @@ class SeasonClubGenerator:
             if existing_data:
                 # Just update lastCheckedDate
                 existing_data['lastCheckedDate'] = end_date.strftime('%Y-%m-%d')
-                existing_data['lastUpdated'] = datetime.now(pacific).isoformat()
+                existing_data['lastUpdated'] = datetime.now(PACIFIC).isoformat()
+                existing_data['processedGameIds'] = self._recent_processed_ids(
+                    all_games, existing_data['lastCheckedDate']
+                )
                 return existing_data
             else:
                 # Return empty data
                 return {
                     'season': season,
-                    'lastUpdated': datetime.now(pacific).isoformat(),
+                    'lastUpdated': datetime.now(PACIFIC).isoformat(),
                     'lastCheckedDate': end_date.strftime('%Y-%m-%d'),
                     'totalGames': 0,
-                    'scorers': []
+                    'scorers': [],
+                    'processedGameIds': []
                 }
 
-        # Scan games for 50+ scorers
-        new_scorers = []
-        processed = 0
-
-        print(f"Scanning {len(games)} game(s) for 50+ point performances...")
-        if len(games) > 10:
-            print("Progress: ", end="", flush=True)
+        # Resume from an interrupted run (e.g. a --full scan that hit a network error)
+        checkpoint = self._load_checkpoint(season)
+        resumed_ids = set(checkpoint['processedGameIds'])
+        new_scorers = checkpoint['newScorers']
 
+        pending_games = []
         for game in games:
-            game_id = game['game_id']
-            game_date = game['date']
+            if game['game_id'] in resumed_ids:
+                self._processed_game_ids.add(game['game_id'])
+            else:
+                pending_games.append(game)
 
-            processed += 1
-            if len(games) > 10 and processed % 10 == 0:
-                print(f"{processed}...", end="", flush=True)
+        if len(pending_games) < len(games):
+            print(f"[RESUME] {len(games) - len(pending_games)} game(s) already scanned by an interrupted run\n")
 
-            scorers_in_game = self.get_box_score(game_id)
+        # Scan games for 50+ scorers
+        processed = 0
+        failed = 0
+        # The next run only scans from lastCheckedDate, so it must not move past
+        # a game that still needs a retry
+        last_checked_date = end_date.strftime('%Y-%m-%d')
 
-            for scorer in scorers_in_game:
-                new_scorers.append({
-                    'date': game_date,
-                    'player': scorer['name'],
-                    'team': scorer['team'],
-                    'points': scorer['points'],
-                    'opponent': game['away_team'] if scorer['team'] == game['home_team'] else game['home_team']
-                })
+        print(f"Scanning {len(pending_games)} game(s) for 50+ point performances...")
+        if len(pending_games) > 10:
+            print("Progress: ", end="", flush=True)
 
-        if len(games) > 10:
+        with ThreadPoolExecutor(max_workers=BOX_SCORE_WORKERS) as executor:
+            futures = {
+                executor.submit(self.get_box_score, game['game_id']): game
+                for game in pending_games
+            }
+
+            # Handle games as they finish so one slow response doesn't stall progress.
+            # Only this (main) thread prints and checkpoints, so output never interleaves.
+            for future in as_completed(futures):
+                game = futures[future]
+                scorers_in_game = future.result()
+
+                processed += 1
+                if len(pending_games) > 10 and processed % 10 == 0:
+                    print(f"{processed}...", end="", flush=True)
+
+                if scorers_in_game is None:
+                    # Leave it out of processedGameIds so the next run retries it
+                    failed += 1
+                    last_checked_date = min(last_checked_date, game['date'])
+                    continue
+
+                self._processed_game_ids.add(game['game_id'])
+
+                for scorer in scorers_in_game:
+                    new_scorers.append({
+                        'date': game['date'],
+                        'player': scorer['name'],
+                        'team': scorer['team'],
+                        'points': scorer['points'],
+                        'opponent': game['away_team'] if scorer['team'] == game['home_team'] else game['home_team']
+                    })
+
+                if processed % CHECKPOINT_INTERVAL == 0:
+                    self._save_checkpoint(season, new_scorers)
+
+        if len(pending_games) > 10:
             print()  # New line after progress
 
         print(f"\nFound {len(new_scorers)} new 50+ point performance(s)!")
+        if failed:
+            print(f"Warning: Could not fetch {failed} box score(s) - will retry next run")
 
-        # Merge with existing data
+        # Merge into the scorer index (existing entries win on duplicates)
+        for scorer in new_scorers:
+            self._scorer_index.setdefault(self._scorer_key(scorer), scorer)
+
+        # Failed games are not counted yet - they are counted when a later run scans them
+        scanned_games = len(games) - failed
         if existing_data and 'scorers' in existing_data:
-            all_scorers = existing_data['scorers'] + new_scorers
-            total_games = existing_data.get('totalGames', 0) + len(games)
+            total_games = existing_data.get('totalGames', 0) + scanned_games
         else:
-            all_scorers = new_scorers
-            total_games = len(games)
-
-        # Remove duplicates (same player, date, points)
-        unique_scorers = []
-        seen = set()
-        for scorer in all_scorers:
-            key = (scorer['date'], scorer['player'], scorer['points'])
-            if key not in seen:
-                seen.add(key)
-                unique_scorers.append(scorer)
+            total_games = scanned_games
 
         # Sort by date (most recent first)
-        unique_scorers.sort(key=lambda x: x['date'], reverse=True)
+        unique_scorers = sorted(self._scorer_index.values(), key=itemgetter('date'), reverse=True)
 
         # Create updated JSON structure
         data = {
             'season': season,
-            'lastUpdated': datetime.now(pacific).isoformat(),
-            'lastCheckedDate': end_date.strftime('%Y-%m-%d'),
+            'lastUpdated': datetime.now(PACIFIC).isoformat(),
+            'lastCheckedDate': last_checked_date,
             'totalGames': total_games,
-            'scorers': unique_scorers
+            'scorers': unique_scorers,
+            'processedGameIds': self._recent_processed_ids(all_games, last_checked_date)
         }
 
         return data
 
+    def _recent_processed_ids(self, games, last_checked_date):
+        """IDs of scanned games dated on or after last_checked_date
+
+        Incremental runs never rescan dates before lastCheckedDate, so older IDs
+        are dead weight in a file the site fetches on every page load
+        """
+        return sorted(
+            game['game_id'] for game in games
+            if game['date'] >= last_checked_date and game['game_id'] in self._processed_game_ids
+        )
+
+    def _load_checkpoint(self, season):
+        """Load progress saved by an interrupted scan of this season, if any"""
+        empty = {'processedGameIds': [], 'newScorers': []}
+
+        if not self.checkpoint_path.exists():
+            return empty
+
+        try:
+            checkpoint = json_loads(self.checkpoint_path.read_bytes())
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable checkpoint: {e}")
+            return empty
+
+        if checkpoint.get('version') != CHECKPOINT_VERSION or checkpoint.get('season') != season:
+            return empty
+
+        return checkpoint
+
+    def _save_checkpoint(self, season, new_scorers):
+        """Atomically save scan progress so an interrupted run can resume
+
+        Only successfully scanned games are in _processed_game_ids, so games
+        whose box score fetch failed are retried after a resume
+        """
+        temp_path = self.checkpoint_path.with_suffix('.json.tmp')
+        try:
+            self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(json_dumps({
+                'version': CHECKPOINT_VERSION,
+                'season': season,
+                'processedGameIds': sorted(self._processed_game_ids),
+                'newScorers': new_scorers
+            }))
+            os.replace(temp_path, self.checkpoint_path)
+        except Exception as e:
+            # A missing checkpoint only costs a rescan, never fail the run over it
+            print(f"\nWarning: Could not save checkpoint: {e}")
+
     def save_to_json(self, data):
-        """Save data to JSON file"""
+        """Save data to JSON file with an atomic write"""
+        temp_path = Path(self.json_path).with_suffix('.json.tmp')
         try:
             # Create directory if it doesn't exist
             output_dir = Path(self.json_path).parent
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Write JSON with nice formatting
-            with open(self.json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write JSON with nice formatting to a temp file first, then swap it in
+            # with os.replace so readers never see a partially written file
+            temp_path.write_bytes(json_dumps(data))
+            os.replace(temp_path, self.json_path)
+
+            # Scan results are safely on disk, so the resume checkpoint is obsolete
+            self.checkpoint_path.unlink(missing_ok=True)
 
             print(f"\n[OK] Data saved to: {self.json_path}")
             print(f"  - Season: {data['season']}")
@@ -296,6 +536,11 @@ class SeasonClubGenerator:
 
         except Exception as e:
             print(f"\n[ERROR] Error saving JSON: {e}")
+            # Clean up temp file if it exists
+            try:
+                temp_path.unlink(missing_ok=True)
+            except Exception:
+                pass
             return False
 
 
@@ -12,12 +12,27 @@ import os
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.retry import Retry
 import time
 import shutil
-from datetime import datetime, timedelta, timezone
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+try:
+    import ijson
+except ImportError:  # Optional - falls back to loading the whole file with json
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # Optional - stdlib json produces identical output, just slower
+    orjson = None
+
 # Only send alerts for games from yesterday (promo active today)
 # DoorDash promo is only active the DAY AFTER a 50+ point game
 # Setting to 1 day prevents:
@@ -30,11 +45,64 @@ MAX_ALERT_AGE_DAYS = 1
 # Set high to prevent false alarms - better to miss an alert than send duplicates
 MIN_SUCCESS_RATE = 0.95  # 95%
 
+# How long sent alert keys are kept in emails.json
+# Must stay well above MAX_ALERT_AGE_DAYS: older games are never alerted anyway,
+# so their keys can't prevent a duplicate and only make the file grow forever
+SENT_ALERTS_RETENTION_DAYS = 30
+
 # Maximum retries for transient API failures
 MAX_RETRIES = 3
 
+# EmailOctopus rate limit: max 10 requests per second
+# Also the number of automation triggers in flight at once
+RATE_LIMIT_PER_SECOND = 10
+
+# Subscriber pages requested concurrently once a list spans more than one page
+PAGE_FETCH_WORKERS = 8
+
+
+def json_loads(raw):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(data):
+    """Encode data as compact UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+class RateLimiter:
+    """Thread-safe request pacer
+
+    Hands out send slots spaced 1/rate seconds apart on the monotonic clock.
+    Callers only sleep until their own slot, and there is no initial burst,
+    so no one-second window ever sees more than `rate` requests
+    """
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until this caller's slot comes up"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+
+        sleep_for = slot - now
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+
 
 class EmailAlertSender:
+    BASE_URL = "https://emailoctopus.com/api/1.6"
+
     def __init__(self, club_data_json_path, emails_json_path):
         self.club_data_json_path = club_data_json_path
         self.emails_json_path = emails_json_path
@@ -55,30 +123,78 @@ class EmailAlertSender:
             print("[ERROR] EMAILOCTOPUS_AUTOMATION_ID environment variable not set")
             sys.exit(1)
 
-        self.base_url = "https://emailoctopus.com/api/1.6"
+        # Endpoints are fixed per run - build them once, not on every request
+        self.subscribed_contacts_url = f"{self.BASE_URL}/lists/{self.list_id}/contacts/subscribed"
+        self.automation_queue_url = f"{self.BASE_URL}/automations/{self.automation_id}/queue"
+        self.session = self._create_session()
+        self.rate_limiter = RateLimiter(RATE_LIMIT_PER_SECOND)
+
+        # Game dates are stored in PT; fix "today" and the season window once per run
+        # rather than re-reading the clock for every scorer
+        self.today = datetime.now(ZoneInfo('America/Los_Angeles')).date()
+        self.season_start = self.today.replace(month=10, day=1)
+        if self.today.month < 10:
+            self.season_start = self.season_start.replace(year=self.today.year - 1)
+
+    def _create_session(self):
+        """Create a shared HTTP session so every API call reuses one keep-alive connection pool"""
+        session = requests.Session()
+        # Subscriber page fetches (GET) are idempotent, so urllib3 may retry them
+        # on 429/5xx with backoff, honouring Retry-After
+        get_retries = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        session.mount('https://', HTTPAdapter(
+            pool_connections=1, pool_maxsize=PAGE_FETCH_WORKERS, max_retries=get_retries
+        ))
+        # Automation POSTs are never replayed by urllib3. A 5xx or read timeout may
+        # come after the contact was queued, and the automation allows multiple
+        # triggers per contact, so a replay could send a second email.
+        # trigger_automation_for_contact retries only the safe cases itself,
+        # taking a rate limit token for every attempt. Sized above the trigger thread pool
+        session.mount(self.automation_queue_url, HTTPAdapter(
+            pool_connections=1, pool_maxsize=20, max_retries=0
+        ))
+        session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip'
+        })
+        return session
 
     def load_club_data(self):
-        """Load 50+ Club data"""
+        """Open 50+ Club data as a lazy stream of scorers
+
+        Returns:
+            iterator: Scorer dicts (parse errors surface while iterating),
+            or None if the file is missing
+        """
         if not os.path.exists(self.club_data_json_path):
             print("[ERROR] 50+ Club data file not found")
             return None
 
-        try:
-            with open(self.club_data_json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"[ERROR] Could not load club data: {e}")
-            return None
+        return self._iter_club_scorers()
+
+    def _iter_club_scorers(self):
+        """Yield scorers one at a time - with ijson the full document is never built"""
+        with open(self.club_data_json_path, 'rb') as f:
+            if ijson is not None:
+                yield from ijson.items(f, 'scorers.item')
+            else:
+                yield from json_loads(f.read()).get('scorers', [])
 
     def load_emails_data(self):
         """Load sent alerts history - FAILS SAFE on corruption"""
         if not os.path.exists(self.emails_json_path):
             print("[INFO] emails.json not found, starting fresh")
-            return {"sent_alerts": []}
+            return {"sent_alerts": set()}
 
         try:
-            with open(self.emails_json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.emails_json_path, 'rb') as f:
+                data = json_loads(f.read())
 
             # Validate structure
             if not isinstance(data, dict):
@@ -86,6 +202,9 @@ class EmailAlertSender:
             if not isinstance(data.get('sent_alerts'), list):
                 raise ValueError("sent_alerts is not a list")
 
+            # Held as a set in memory for O(1) membership checks and
+            # duplicate-free adds; save_emails_data writes it back as a sorted list
+            data['sent_alerts'] = set(data['sent_alerts'])
             return data
 
         except Exception as e:
@@ -105,25 +224,33 @@ class EmailAlertSender:
             print("[CRITICAL] Exiting to prevent duplicate alerts. Please fix emails.json manually.")
             sys.exit(1)
 
+    def _prune_sent_alerts(self, sent_alerts):
+        """Drop alert keys older than SENT_ALERTS_RETENTION_DAYS
+
+        Keys start with the game's ISO date (YYYY-MM-DD_Player_Points), which
+        sorts lexically, so a plain string compare against the cutoff is enough
+        """
+        cutoff = (self.today - timedelta(days=SENT_ALERTS_RETENTION_DAYS)).isoformat()
+        return {key for key in sent_alerts if key[:10] >= cutoff}
+
     def save_emails_data(self, data):
-        """Save sent alerts history with validation and atomic write"""
+        """Save sent alerts history with an atomic write"""
         temp_path = str(self.emails_json_path) + ".tmp"
+        # On disk sent_alerts stays a JSON list; sorting keeps it deterministic for git diffs
+        data = {**data, 'sent_alerts': sorted(self._prune_sent_alerts(data['sent_alerts']))}
         try:
-            # Write to temp file first
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to temp file first (compact - this file is only read by scripts).
+            # The bytes come straight from our own serializer, so there is no need to
+            # read them back; the fsync makes sure they hit disk before the rename
+            with open(temp_path, 'wb') as f:
+                f.write(json_dumps(data))
                 f.flush()
                 os.fsync(f.fileno())
 
-            # Validate the temp file is readable and correct
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                validated = json.load(f)
-                if not isinstance(validated.get('sent_alerts'), list):
-                    raise ValueError("Validation failed: sent_alerts is not a list")
-
             # Use os.replace for atomic rename (works on both Windows and POSIX)
             # This is more reliable than shutil.move which may copy+delete on Windows
             os.replace(temp_path, self.emails_json_path)
+            self._fsync_parent_dir(self.emails_json_path)
             return True
 
         except Exception as e:
@@ -136,70 +263,113 @@ class EmailAlertSender:
                 pass
             return False
 
+    @staticmethod
+    def _fsync_parent_dir(path):
+        """Persist a rename by fsyncing the containing directory (POSIX only)"""
+        try:
+            dir_fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        except OSError:
+            return  # Windows can't open directories; os.replace is already durable there
+        try:
+            os.fsync(dir_fd)
+        except OSError:
+            pass
+        finally:
+            os.close(dir_fd)
+
+    def _fetch_contacts_page(self, page):
+        """Fetch one page (100 contacts) of the list's SUBSCRIBED contacts
+
+        Uses the /contacts/subscribed endpoint so the API filters out pending and
+        unsubscribed contacts instead of sending them over the wire
+        """
+        # Concurrent page probes share the 10 req/s budget with the triggers
+        self.rate_limiter.acquire()
+        return self.session.get(
+            self.subscribed_contacts_url,
+            params={
+                "api_key": self.api_key,
+                "limit": 100,
+                "page": page
+            },
+            timeout=30
+        )
+
     def get_all_subscribers(self):
         """Get all subscribed contacts from the list
 
+        Page 1 is fetched on its own (most runs need nothing more). If there are
+        more pages, the API doesn't report a total, so the next
+        PAGE_FETCH_WORKERS pages are requested concurrently and processed in
+        order until one has no `paging.next`.
+
         Returns:
             list: List of subscribers, or None if API failed
         """
         subscribers = []
         page = 1
-        api_called = False
 
-        while True:
-            try:
-                response = requests.get(
-                    f"{self.base_url}/lists/{self.list_id}/contacts",
-                    params={
-                        "api_key": self.api_key,
-                        "limit": 100,
-                        "page": page
-                    },
-                    timeout=30
-                )
-                api_called = True
-
-                if not response.ok:
-                    print(f"[ERROR] Failed to get subscribers (HTTP {response.status_code}): {response.text}")
-                    self.api_fetch_failed = True
-                    return None  # Return None to indicate API failure
-
-                data = response.json()
-                contacts = data.get('data', [])
-
-                # Filter for subscribed contacts only
-                for contact in contacts:
-                    if contact.get('status') == 'SUBSCRIBED':
-                        subscribers.append({
-                            'id': contact.get('id'),
-                            'email': contact.get('email_address')
-                        })
-
-                # Check if there are more pages
-                paging = data.get('paging', {})
-                if not paging.get('next'):
-                    break
-
-                page += 1
-
-            except requests.exceptions.Timeout:
-                print("[ERROR] Timeout while fetching subscribers")
-                self.api_fetch_failed = True
-                return None
-            except requests.exceptions.RequestException as e:
-                print(f"[ERROR] Network error fetching subscribers: {e}")
-                self.api_fetch_failed = True
-                return None
-            except Exception as e:
-                print(f"[ERROR] Failed to fetch subscribers: {e}")
-                self.api_fetch_failed = True
-                return None
+        try:
+            with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+                responses = [self._fetch_contacts_page(page)]
+
+                while True:
+                    has_more = False
+
+                    for response in responses:
+                        if not response.ok:
+                            print(f"[ERROR] Failed to get subscribers (HTTP {response.status_code}): {response.text}")
+                            self.api_fetch_failed = True
+                            return None  # Return None to indicate API failure
+
+                        data = json_loads(response.content)
+                        contacts = data.get('data', [])
+
+                        for contact in contacts:
+                            subscribers.append({
+                                'id': contact.get('id'),
+                                'email': contact.get('email_address')
+                            })
+
+                        # Check if there are more pages (later probed pages are past the end)
+                        paging = data.get('paging', {})
+                        has_more = bool(paging.get('next'))
+                        if not has_more:
+                            break
+
+                        page += 1
+
+                    if not has_more:
+                        break
+
+                    responses = list(executor.map(
+                        self._fetch_contacts_page,
+                        range(page, page + PAGE_FETCH_WORKERS)
+                    ))
+
+        except requests.exceptions.Timeout:
+            print("[ERROR] Timeout while fetching subscribers")
+            self.api_fetch_failed = True
+            return None
+        except requests.exceptions.RequestException as e:
+            print(f"[ERROR] Network error fetching subscribers: {e}")
+            self.api_fetch_failed = True
+            return None
+        except Exception as e:
+            print(f"[ERROR] Failed to fetch subscribers: {e}")
+            self.api_fetch_failed = True
+            return None
 
         return subscribers
 
     def validate_scorer(self, scorer):
-        """Validate scorer data to prevent false alarms from corrupted data"""
+        """Validate scorer data to prevent false alarms from corrupted data
+
+        Returns:
+            (errors, game_date) - game_date is None if the date could not be parsed
+        """
         errors = []
+        game_date = None
 
         # Check required fields exist
         if not scorer.get('player'):
@@ -224,17 +394,16 @@ class EmailAlertSender:
         # Validate date format
         date_str = scorer.get('date', '')
         try:
-            game_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+            # fromisoformat is C-fast but also accepts other ISO forms (20261005,
+            # 2026-W41-1) on 3.11+; alert keys need exactly YYYY-MM-DD, so require a round trip
+            game_date = date.fromisoformat(date_str)
+            if game_date.isoformat() != date_str:
+                raise ValueError(date_str)
             # Check date is not in the future (use PT since game dates are in PT)
-            pacific = ZoneInfo('America/Los_Angeles')
-            today = datetime.now(pacific).date()
-            if game_date > today:
+            if game_date > self.today:
                 errors.append(f"game date in future: {date_str}")
             # Check date is within current season (not years ago)
-            season_start = today.replace(month=10, day=1)
-            if today.month < 10:
-                season_start = season_start.replace(year=today.year - 1)
-            if game_date < season_start:
+            if game_date < self.season_start:
                 errors.append(f"game date before season start: {date_str}")
         except ValueError:
             errors.append(f"invalid date format: {date_str}")
@@ -244,47 +413,56 @@ class EmailAlertSender:
         if team and (len(team) < 2 or len(team) > 4 or not team.isupper()):
             errors.append(f"invalid team abbreviation: {team}")
 
-        return errors
+        return errors, game_date
 
-    def get_new_scorers(self, club_data, emails_data):
-        """Get scorers that haven't been alerted yet and are recent enough"""
-        sent_alerts = set(emails_data.get('sent_alerts', []))
-        scorers = club_data.get('scorers', [])
+    def get_new_scorers(self, scorers, sent_alerts):
+        """Get scorers that haven't been alerted yet and are recent enough
 
-        # Use Pacific Time since game dates are stored in PT
+        Args:
+            scorers: Iterable of scorer dicts (consumed once)
+            sent_alerts: Set of alert keys already sent
+        """
+        # self.today is in Pacific Time since game dates are stored in PT
         # This ensures the alert age check matches the game date timezone
-        pacific = ZoneInfo('America/Los_Angeles')
-        today = datetime.now(pacific).date()
-        cutoff_date = today - timedelta(days=MAX_ALERT_AGE_DAYS)
+        cutoff_date = self.today - timedelta(days=MAX_ALERT_AGE_DAYS)
 
         new_scorers = []
         skipped_old = []
         skipped_invalid = []
+        # Re-scrapes can repeat the same (date, player, points) entry; once one
+        # copy has passed validation the others are skipped without revalidating.
+        # Keys are only recorded after validation, so an invalid copy never hides
+        # a valid one (the key ignores team, which validation also checks)
+        seen_keys = set()
 
         for scorer in scorers:
+            alert_key = f"{scorer.get('date')}_{scorer.get('player')}_{scorer.get('points')}"
+            if alert_key in seen_keys:
+                continue
+
             # Validate scorer data to prevent false alarms
-            validation_errors = self.validate_scorer(scorer)
+            # A bad date is reported as a validation error, so game_date is
+            # always parsed once we get past this check
+            validation_errors, game_date = self.validate_scorer(scorer)
             if validation_errors:
                 skipped_invalid.append((scorer, validation_errors))
                 continue
+            seen_keys.add(alert_key)
 
-            alert_key = f"{scorer['date']}_{scorer['player']}_{scorer['points']}"
+            # Check if game is recent enough (promo only active day after game)
+            if game_date < cutoff_date:
+                if alert_key not in sent_alerts:
+                    skipped_old.append(scorer)
+                # Scorers are stored newest first (the generator sorts by date descending),
+                # so every remaining entry is older still - stop instead of scanning the
+                # whole season. If the order were ever broken this can only miss an
+                # alert, never send a stale one.
+                break
 
             # Skip if already alerted
             if alert_key in sent_alerts:
                 continue
 
-            # Check if game is recent enough (promo only active day after game)
-            try:
-                game_date = datetime.strptime(scorer['date'], '%Y-%m-%d').date()
-                if game_date < cutoff_date:
-                    skipped_old.append(scorer)
-                    continue
-            except ValueError as e:
-                # Log date parsing failures (don't skip silently)
-                print(f"[WARN] Invalid date format for {scorer.get('player', 'unknown')}: {scorer.get('date')} - {e}")
-                continue
-
             new_scorers.append({
                 'alert_key': alert_key,
                 'scorer': scorer
@@ -293,62 +471,93 @@ class EmailAlertSender:
         # Log skipped invalid scorers (potential data corruption)
         if skipped_invalid:
             print(f"[WARN] Skipping {len(skipped_invalid)} invalid scorer(s) (possible data corruption):")
-            for scorer, errors in skipped_invalid:
-                print(f"  - {scorer.get('player', '?')}: {', '.join(errors)}")
+            print("\n".join(
+                f"  - {scorer.get('player', '?')}: {', '.join(errors)}"
+                for scorer, errors in skipped_invalid
+            ))
 
         # Log skipped old games for visibility
         if skipped_old:
             print(f"[INFO] Skipping {len(skipped_old)} old game(s) (older than {MAX_ALERT_AGE_DAYS} day(s) - promo expired):")
-            for scorer in skipped_old:
-                print(f"  - {scorer['player']}: {scorer['points']} pts on {scorer['date']}")
+            print("\n".join(
+                f"  - {scorer['player']}: {scorer['points']} pts on {scorer['date']}"
+                for scorer in skipped_old
+            ))
 
         return new_scorers
 
+    @staticmethod
+    def _never_connected(error):
+        """True if a ConnectionError happened before any request bytes were sent
+
+        requests also raises ConnectionError when the server drops the connection
+        after reading the request, so only a connect timeout or a failure to open
+        the socket (refused, DNS) is safe to retry
+        """
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        # urllib3's NameResolutionError is a NewConnectionError subclass
+        return isinstance(reason, NewConnectionError)
+
     def trigger_automation_for_contact(self, contact_id):
-        """Trigger the automation for a single contact with retry logic"""
+        """Trigger the automation for a single contact
+
+        Only retries when the API cannot have queued the contact: a 429 or a
+        connection that was never established. Anything else (5xx, read timeout,
+        a connection dropped after the request was sent) is reported as a
+        failure rather than risking a duplicate email
+        """
         last_error = None
 
         for attempt in range(MAX_RETRIES):
+            self.rate_limiter.acquire()
             try:
-                response = requests.post(
-                    f"{self.base_url}/automations/{self.automation_id}/queue",
+                response = self.session.post(
+                    self.automation_queue_url,
                     json={
                         "api_key": self.api_key,
                         "list_member_id": contact_id
                     },
                     timeout=10
                 )
+            except requests.exceptions.ConnectionError as e:
+                if not self._never_connected(e):
+                    # e.g. 'Connection aborted' after the body went out - the contact
+                    # may already be queued, so don't replay
+                    return False, str(e)
+                last_error = str(e)
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(2 ** attempt)
+                continue
+            except requests.exceptions.Timeout:
+                # Read timeout - the contact may already be queued, so don't replay
+                return False, 'TIMEOUT'
+            except requests.exceptions.RequestException as e:
+                return False, str(e)
 
-                if response.ok:
-                    return True, None
-                else:
-                    error_data = response.json() if response.text else {}
-                    error_code = error_data.get('error', {}).get('code', 'UNKNOWN')
+            if response.ok:
+                return True, None
 
-                    # ALREADY_STARTED is not a failure - contact already received this automation
-                    if error_code == 'ALREADY_STARTED':
-                        return True, 'already_started'
+            if response.status_code == 429:
+                # Rate limited - wait as long as the API asks (or back off) and retry
+                last_error = 'RATE_LIMITED'
+                retry_after = response.headers.get('Retry-After', '')
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(int(retry_after) if retry_after.isdecimal() else 2 ** attempt)
+                continue
 
-                    # Rate limit - wait and retry
-                    if response.status_code == 429:
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        time.sleep(wait_time)
-                        last_error = 'RATE_LIMITED'
-                        continue
+            try:
+                error_data = json_loads(response.content) if response.content else {}
+                error_code = error_data.get('error', {}).get('code', 'UNKNOWN')
+            except (ValueError, AttributeError):
+                error_code = f'HTTP_{response.status_code}'
 
-                    last_error = error_code
-                    return False, error_code
+            # ALREADY_STARTED is not a failure - contact already received this automation
+            if error_code == 'ALREADY_STARTED':
+                return True, 'already_started'
 
-            except requests.exceptions.Timeout:
-                last_error = 'TIMEOUT'
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(2 ** attempt)
-                    continue
-            except Exception as e:
-                last_error = str(e)
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(2 ** attempt)
-                    continue
+            return False, error_code
 
         return False, last_error
 
@@ -360,23 +569,29 @@ class EmailAlertSender:
 
         # Load data
         emails_data = self.load_emails_data()
-        club_data = self.load_club_data()
+        club_scorers = self.load_club_data()
 
-        if not club_data:
+        if club_scorers is None:
             print("[ERROR] No club data available")
             return False
 
         # Get new scorers (not yet alerted)
-        new_scorers = self.get_new_scorers(club_data, emails_data)
+        # Club data is streamed, so a corrupt file is only detected here
+        try:
+            new_scorers = self.get_new_scorers(club_scorers, emails_data['sent_alerts'])
+        except Exception as e:
+            print(f"[ERROR] Could not load club data: {e}")
+            return False
 
         if not new_scorers:
             print("[INFO] No new 50+ point games to alert about")
             return True
 
         print(f"[INFO] Found {len(new_scorers)} new 50+ point performance(s):")
-        for item in new_scorers:
-            scorer = item['scorer']
-            print(f"  - {scorer['player']}: {scorer['points']} pts on {scorer['date']}")
+        print("\n".join(
+            f"  - {item['scorer']['player']}: {item['scorer']['points']} pts on {item['scorer']['date']}"
+            for item in new_scorers
+        ))
 
         # Get all subscribers
         print("\n[INFO] Fetching subscribers...")
@@ -391,8 +606,7 @@ class EmailAlertSender:
         if len(subscribers) == 0:
             print("[INFO] No subscribers yet - marking alerts as sent")
             for item in new_scorers:
-                if item['alert_key'] not in emails_data['sent_alerts']:
-                    emails_data['sent_alerts'].append(item['alert_key'])
+                emails_data['sent_alerts'].add(item['alert_key'])
             if not self.save_emails_data(emails_data):
                 print("[CRITICAL] Failed to save - alerts may be re-sent next run")
                 return False
@@ -406,22 +620,34 @@ class EmailAlertSender:
         skip_count = 0
         fail_count = 0
 
-        for i, subscriber in enumerate(subscribers):
-            success, error = self.trigger_automation_for_contact(subscriber['id'])
-
-            if success:
-                if error == 'already_started':
-                    skip_count += 1
+        # Each trigger is an independent HTTPS round-trip, so overlap them instead of
+        # paying the latency of every request one by one. Rate limiting (max 10
+        # requests per second) is enforced per request by self.rate_limiter.
+        with ThreadPoolExecutor(max_workers=RATE_LIMIT_PER_SECOND) as executor:
+            results = executor.map(
+                lambda subscriber: self.trigger_automation_for_contact(subscriber['id']),
+                subscribers
+            )
+
+            # Failures are collected and written in one go after the loop rather
+            # than flushing stdout once per failed contact
+            warn_lines = []
+
+            for i, (subscriber, (success, error)) in enumerate(zip(subscribers, results)):
+                if success:
+                    if error == 'already_started':
+                        skip_count += 1
+                    else:
+                        success_count += 1
                 else:
-                    success_count += 1
-            else:
-                fail_count += 1
-                print(f"  [WARN] Failed for {subscriber['email']}: {error}")
+                    fail_count += 1
+                    warn_lines.append(f"  [WARN] Failed for {subscriber['email']}: {error}")
+
+                if (i + 1) % 100 == 0:
+                    print(f"  Progress: {i + 1}/{len(subscribers)}...")
 
-            # Rate limiting: max 10 requests per second
-            if (i + 1) % 10 == 0:
-                time.sleep(1)
-                print(f"  Progress: {i + 1}/{len(subscribers)}...")
+        if warn_lines:
+            sys.stdout.write("\n".join(warn_lines) + "\n")
 
         print(f"\n[RESULT] Triggered: {success_count}, Skipped: {skip_count}, Failed: {fail_count}")
 
@@ -451,8 +677,7 @@ class EmailAlertSender:
         # Only mark as sent if success rate is high enough
         if success_rate >= MIN_SUCCESS_RATE:
             for item in new_scorers:
-                if item['alert_key'] not in emails_data['sent_alerts']:
-                    emails_data['sent_alerts'].append(item['alert_key'])
+                emails_data['sent_alerts'].add(item['alert_key'])
 
             if self.save_emails_data(emails_data):
                 print("[OK] Alert tracking updated")